@@ -1,10 +1,10 @@
 #!/usr/bin/env python
 # declare our imports
+import logging
 import os
 from os.path import exists
 import shutil
 import sys
-import cups
 
 # declare our global variables
 # ###photo information
@@ -29,6 +29,10 @@ imageStore = "./storedImages"
 imageBackup = "./photoStore"
 storageDrive = "/media/max/NIKON\ D700/DCIM/171ND700"
 printDrive = "/media/max/NIKON\ D700"
+# ###seconds between checks of the image queue
+pollInterval = 5
+
+logger = logging.getLogger(__name__)
 
 
 def check_photos(photos_across=photosAcross, photos_down=photosDown, number_of_photos=numberOfPhotos,
@@ -47,34 +51,46 @@ def check_user(user):
 
 
 def create_folders():
-    if not os.path.exists(imageQueue):
-        os.makedirs(imageQueue)
-    if not os.path.exists(imageStore):
-        os.makedirs(imageStore)
-    if not os.path.exists(imageBackup):
-        os.makedirs(imageBackup)
-    if not os.path.exists(os.path.join(imageStore, 'prints')):
-        os.makedirs(os.path.join(imageStore, 'prints'))
+    # imageStore is created along with its prints folder
+    os.makedirs(imageQueue, exist_ok=True)
+    os.makedirs(imageBackup, exist_ok=True)
+    os.makedirs(os.path.join(imageStore, 'prints'), exist_ok=True)
 
 
 def ready_to_process():
-    return len(os.listdir(imageQueue)) >= 3
+    # stop reading the queue as soon as we have enough photos
+    count = 0
+    with os.scandir(imageQueue) as entries:
+        for _ in entries:
+            count += 1
+            if count >= 3:
+                return True
+    return False
 
 
 if __name__ == "__main__":
     import time, getpass, datetime
+    import cups  # only needed for printing, keep it out of module import
 
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
     imageSet = 0
     check_photos()  # sanity check for correct setup
     check_user(getpass.getuser())  # sanity check for correct user
     create_folders()  # ensure required folders exist
 
     # need a loop that just runs forever, and when ready_to_process we do things, then return to the loop
+    nextPoll = time.monotonic()
     while True:
         if ready_to_process():
-            print('processing!!!')
-        print('waiting for photos!!!')
-        time.sleep(5)
+            logger.info('processing!!!')
+        logger.info('waiting for photos!!!')
+        # keep a steady cadence no matter how long processing took
+        nextPoll += pollInterval
+        now = time.monotonic()
+        if nextPoll > now:
+            time.sleep(nextPoll - now)
+        else:
+            nextPoll = now
 
     # imageSet = sum(os.path.isdir(os.path.join(imageStore, f)) for f in os.listdir(imageStore))
     # batchSet = sum(os.path.isdir(os.path.join(imageBackup, f)) for f in os.listdir(imageBackup)) + 1